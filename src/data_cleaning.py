@@ -14,7 +14,7 @@ Your cleaned dataset should be saved to: data/cleaned/telco_churn_cleaned.csv
 
 import numpy as np
 import pandas as pd
-from src.utils import RAW_DATA_PATH, CLEANED_DATA_PATH
+from src.utils import RAW_DATA_PATH, CLEANED_DATA_PATH, format_write_stats, output_path, write_csv
 
 
 # DONE
@@ -159,13 +159,11 @@ def save_cleaned_data(df: pd.DataFrame) -> None:
     Args:
         df: The cleaned dataframe to save.
 
-    Saves to: data/cleaned/telco_churn_cleaned.csv (without the index)
+    Saves to: data/cleaned/telco_churn_cleaned.csv (without the index),
+    plus a .gz/.bz2/.xz extension when OUTPUT_COMPRESSION is set.
     """
-    # TODO: Save to CLEANED_DATA_PATH using df.to_csv(..., index=False)
-
-    df.to_csv(CLEANED_DATA_PATH, index=False)
-    print(f"Success! Cleaned data saved to: {CLEANED_DATA_PATH}")
-    pass
+    stats = write_csv(df, CLEANED_DATA_PATH)
+    print(f"Success! Cleaned data saved to: {stats['path']} ({format_write_stats(stats)})")
 
 
 def run_cleaning_pipeline() -> pd.DataFrame:
@@ -187,7 +185,7 @@ def run_cleaning_pipeline() -> pd.DataFrame:
     df = check_for_duplicates(df)
 
     save_cleaned_data(df)
-    print(f"  Cleaned data saved to {CLEANED_DATA_PATH}")
+    print(f"  Cleaned data saved to {output_path(CLEANED_DATA_PATH)}")
     print("Data cleaning complete!")
 
     return df
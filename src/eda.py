@@ -1,6 +1,6 @@
 import pandas as pd
 import matplotlib.pyplot as plt
-from src.utils import load_cleaned_data, FIGURES_PATH
+from src.utils import load_cleaned_data, churn_by_category, FIGURES_PATH
 
 
 def plot_churn_distribution(df: pd.DataFrame) -> None:
@@ -27,7 +27,7 @@ def plot_monthly_charges_by_churn(df: pd.DataFrame) -> None:
     
 
 def plot_churn_by_contract(df: pd.DataFrame) -> None:
-    churn_rates=df.groupby("Contract").apply(lambda x: (x["Churn"]=="Yes").mean()*100,include_groups="False")
+    churn_rates=churn_by_category(df,"Contract")["churn_rate"]
     churn_rates.plot(kind="bar",rot=15)
     plt.title("Churn Rate by Contract Type")
     plt.xlabel("Contract types (Month-to-month, One year, Two year)")
@@ -39,7 +39,7 @@ def plot_churn_by_contract(df: pd.DataFrame) -> None:
 
 
 def plot_churn_by_internet_service(df: pd.DataFrame) -> None:
-    churn_rates=df.groupby("InternetService").apply(lambda x: (x["Churn"]=="Yes").mean()*100,include_groups="False")
+    churn_rates=churn_by_category(df,"InternetService")["churn_rate"]
     churn_rates.plot(kind="bar",rot=0)
     plt.title("Churn Rate by Internet Service Type")
     plt.xlabel("Internet service types (DSL, Fiber optic, No)")
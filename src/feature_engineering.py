@@ -9,17 +9,211 @@ Save the engineered dataset to: data/cleaned/telco_churn_engineered.csv
 
 You'll do 3 things:
 1. Encode binary columns (Yes/No -> 1/0)
-2. Create a new 'tenure_group' column that groups customers by how long they've stayed
+2. Add derived columns such as 'tenure_group' (how long a customer has stayed)
+   from the derived-feature registry
 3. Encode multi-category columns into dummy variables
 """
 
+from graphlib import CycleError, TopologicalSorter
+
+import numpy as np
 import pandas as pd
-from src.utils import load_cleaned_data
+from src.utils import format_write_stats, load_cleaned_data, output_path, write_csv
 
 
 ENGINEERED_DATA_PATH = "data/cleaned/telco_churn_engineered.csv"
 
 
+# === Derived feature registry ===
+# Every derived column is registered here together with the columns it reads.
+# An input can be a column of the dataframe or another registered feature.
+# compute_derived_features() orders the requested features so dependencies
+# come first, then fills all of them in one vectorised pass per chunk.
+
+DERIVED_FEATURES = {}
+
+TENURE_GROUP_LABELS = ["0-1 year", "1-2 years", "2-4 years", "4-5 years", "5-6 years"]
+TENURE_GROUP_UPPER_BOUNDS = [12, 24, 48, 60, 72]
+MAX_TENURE = TENURE_GROUP_UPPER_BOUNDS[-1]
+
+# tenure is a small integer (0-72 months), so the group of every possible value
+# is worked out once here. The extra last slot catches anything out of range.
+_TENURE_GROUP_LOOKUP = np.array(
+    [
+        TENURE_GROUP_LABELS[np.searchsorted(TENURE_GROUP_UPPER_BOUNDS, months)]
+        for months in range(MAX_TENURE + 1)
+    ]
+    + ["nan"],
+    dtype=object,
+)
+
+# Derived features written to the engineered CSV. Others stay available
+# through compute_derived_features() but are only added when asked for.
+PIPELINE_FEATURES = ["tenure_group"]
+
+SERVICE_COLUMNS = [
+    "PhoneService",
+    "MultipleLines",
+    "InternetService",
+    "OnlineSecurity",
+    "OnlineBackup",
+    "DeviceProtection",
+    "TechSupport",
+    "StreamingTV",
+    "StreamingMovies",
+]
+
+
+def register_feature(name: str, inputs: list):
+    """
+    Decorator that adds a derived feature to DERIVED_FEATURES.
+
+    The decorated function receives a dict mapping each input name to a
+    numpy array (one chunk of rows) and must return an array of the same length.
+
+    Example:
+        >>> @register_feature("double_tenure", inputs=["tenure"])
+        ... def _double_tenure(cols):
+        ...     return cols["tenure"] * 2
+    """
+    def decorator(func):
+        DERIVED_FEATURES[name] = {"inputs": list(inputs), "compute": func}
+        return func
+
+    return decorator
+
+
+def _is_yes(values: np.ndarray) -> np.ndarray:
+    """Boolean mask of 'Yes' values, also accepting columns already encoded as 1/0."""
+    if values.dtype == object:
+        return (values == "Yes") | (values == 1)
+    return values == 1
+
+
+@register_feature("tenure_group", inputs=["tenure"])
+def _tenure_group(cols: dict) -> np.ndarray:
+    tenure = cols["tenure"].astype(float)
+    # Only whole months 0-72 have a slot; anything else (incl. NaN, 12.5) gets 'nan'
+    in_range = (tenure >= 0) & (tenure <= MAX_TENURE) & (tenure == np.floor(tenure))
+    positions = np.where(in_range, tenure, MAX_TENURE + 1).astype(np.intp)
+    return _TENURE_GROUP_LOOKUP[positions]
+
+
+@register_feature("charges_per_tenure_month", inputs=["TotalCharges", "tenure"])
+def _charges_per_tenure_month(cols: dict) -> np.ndarray:
+    # Customers with tenure 0 have not been billed yet, so they get 0.0
+    total = cols["TotalCharges"].astype(float)
+    tenure = cols["tenure"].astype(float)
+    return np.divide(total, tenure, out=np.zeros(len(total)), where=tenure > 0)
+
+
+@register_feature("num_services", inputs=SERVICE_COLUMNS)
+def _num_services(cols: dict) -> np.ndarray:
+    count = np.zeros(len(cols["InternetService"]), dtype=int)
+    for col in SERVICE_COLUMNS:
+        if col == "InternetService":
+            count += cols[col] != "No"
+        else:
+            count += _is_yes(cols[col])
+    return count
+
+
+@register_feature("has_streaming", inputs=["StreamingTV", "StreamingMovies"])
+def _has_streaming(cols: dict) -> np.ndarray:
+    return (_is_yes(cols["StreamingTV"]) | _is_yes(cols["StreamingMovies"])).astype(int)
+
+
+def resolve_feature_order(features: list) -> list:
+    """
+    Return the requested features plus everything they depend on,
+    ordered so that each feature comes after its inputs.
+
+    Args:
+        features: Names of registered features.
+
+    Returns:
+        list: Feature names in a safe computation order.
+
+    Raises:
+        ValueError: If a name is not registered or the dependencies form a cycle.
+    """
+    graph = {}
+    to_visit = list(features)
+    while to_visit:
+        name = to_visit.pop()
+        if name in graph:
+            continue
+        if name not in DERIVED_FEATURES:
+            raise ValueError(f"Unknown derived feature: '{name}'")
+        deps = [col for col in DERIVED_FEATURES[name]["inputs"] if col in DERIVED_FEATURES]
+        graph[name] = deps
+        to_visit.extend(deps)
+
+    try:
+        return list(TopologicalSorter(graph).static_order())
+    except CycleError as err:
+        raise ValueError(f"Derived features have a circular dependency: {err.args[1]}") from err
+
+
+def compute_derived_features(
+    df: pd.DataFrame,
+    features: list = None,
+    chunksize: int = None,
+) -> pd.DataFrame:
+    """
+    Add derived feature columns to the dataframe.
+
+    Only the requested features are added. Features they depend on are
+    computed along the way but not kept unless they were requested too.
+
+    Args:
+        df: The dataframe holding every input column the features need.
+        features: Names from DERIVED_FEATURES. Defaults to all of them.
+        chunksize: Rows per pass. Defaults to the whole frame in one pass.
+
+    Returns:
+        pd.DataFrame: Dataframe with one new column per requested feature.
+
+    Example:
+        >>> df = compute_derived_features(df, ["tenure_group", "has_streaming"])
+        >>> df['has_streaming'].unique()
+        array([0, 1])
+    """
+    if features is None:
+        features = list(DERIVED_FEATURES)
+    order = resolve_feature_order(features)
+
+    raw_inputs = {
+        col
+        for name in order
+        for col in DERIVED_FEATURES[name]["inputs"]
+        if col not in DERIVED_FEATURES
+    }
+    missing = sorted(raw_inputs - set(df.columns))
+    if missing:
+        raise ValueError(f"Missing input columns for derived features: {missing}")
+
+    # Pull every input column out once; chunks below are cheap slices of these
+    arrays = {col: df[col].to_numpy() for col in raw_inputs}
+
+    n_rows = len(df)
+    chunksize = chunksize or max(n_rows, 1)
+    starts = range(0, n_rows, chunksize) if n_rows else [0]
+
+    pieces = {name: [] for name in features}
+    for start in starts:
+        cols = {col: values[start:start + chunksize] for col, values in arrays.items()}
+        for name in order:
+            cols[name] = np.asarray(DERIVED_FEATURES[name]["compute"](cols))
+            if name in pieces:
+                pieces[name].append(cols[name])
+
+    for name in features:
+        df[name] = np.concatenate(pieces[name])
+
+    return df
+
+
 def encode_binary_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Convert all Yes/No columns to 1/0.
@@ -78,19 +272,12 @@ def create_tenure_groups(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Dataframe with a new 'tenure_group' column added.
 
-    Hints:
-        - Use pd.cut() which automatically sorts values into bins:
-            pd.cut(
-                df['tenure'],
-                bins=[0, 12, 24, 48, 60, 72],
-                labels=['0-1 year', '1-2 years', '2-4 years', '4-5 years', '5-6 years']
-            )
-        - pd.cut() returns a special "Categorical" type — convert it to plain strings
-          using .astype(str) so it's easier to work with later.
-        - Assign the result to df['tenure_group']
-    """
-    # TODO: Create tenure groups using pd.cut()
-    pass
+    Tenure only takes 73 possible values, so instead of pd.cut() the group
+    is read from a precomputed lookup table (see the 'tenure_group' entry
+    in DERIVED_FEATURES). Tenure 0 falls in '0-1 year' as in the table above;
+    values that are not whole months between 0 and 72 become 'nan'.
+    """
+    return compute_derived_features(df, ["tenure_group"])
 
 
 def encode_multi_category_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -135,10 +322,11 @@ def save_engineered_data(df: pd.DataFrame) -> None:
     Args:
         df: The engineered dataframe to save.
 
-    Saves to: data/cleaned/telco_churn_engineered.csv (without the index)
+    Saves to: data/cleaned/telco_churn_engineered.csv (without the index),
+    plus a .gz/.bz2/.xz extension when OUTPUT_COMPRESSION is set.
     """
-    # TODO: Save to ENGINEERED_DATA_PATH using df.to_csv(..., index=False)
-    pass
+    stats = write_csv(df, ENGINEERED_DATA_PATH)
+    print(f"  Wrote {format_write_stats(stats)}")
 
 
 def run_feature_engineering_pipeline() -> pd.DataFrame:
@@ -155,17 +343,17 @@ def run_feature_engineering_pipeline() -> pd.DataFrame:
     df = encode_binary_columns(df)
     print("  Encoded binary columns")
 
-    df = create_tenure_groups(df)
-    print("  Created tenure groups")
+    df = compute_derived_features(df, PIPELINE_FEATURES)
+    print(f"  Added derived features: {', '.join(PIPELINE_FEATURES)}")
 
-    # Note: We run encode_multi_category_columns AFTER tenure_groups
+    # Note: We run encode_multi_category_columns AFTER the derived features
     # because get_dummies changes the column structure significantly,
-    # and it's easier to add 'tenure_group' before that happens.
+    # and the features read the original service/contract columns.
     df = encode_multi_category_columns(df)
     print(f"  Encoded multi-category columns -> {len(df.columns)} total columns")
 
     save_engineered_data(df)
-    print(f"  Engineered data saved to {ENGINEERED_DATA_PATH}")
+    print(f"  Engineered data saved to {output_path(ENGINEERED_DATA_PATH)}")
     print("Feature Engineering complete!")
 
     return df
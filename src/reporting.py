@@ -14,9 +14,10 @@ You'll create functions that:
 """
 
 import pandas as pd
-from src.utils import load_cleaned_data, REPORTS_PATH
+from src.utils import load_cleaned_data, memoize_aggregation, aggregation_cache_info, churn_by_category, REPORTS_PATH
 
 
+@memoize_aggregation(columns=["Churn", "MonthlyCharges", "tenure"])
 def get_dataset_summary(df: pd.DataFrame) -> dict:
     """
     Calculate basic summary statistics about the dataset.
@@ -63,33 +64,11 @@ def get_dataset_summary(df: pd.DataFrame) -> dict:
 def get_churn_by_category(df: pd.DataFrame, column: str) -> pd.DataFrame:
     """
     Calculate the churn rate for each unique value in a given column.
-    """
-
-    # Step 1 — Count total customers per category
-    total = df.groupby(column).size().rename("total")
-
-    # Step 2 — Count churned customers per category
-    churned = (
-        df[df["Churn"] == "Yes"]
-        .groupby(column)
-        .size()
-        .rename("churned")
-    )
-
-    # Step 3 — Combine totals and churned counts
-    result = pd.concat([total, churned], axis=1).fillna(0)
 
-    # Ensure churned is integer (after fillna it may become float)
-    result["churned"] = result["churned"].astype(int)
-
-    # Step 4 — Calculate churn rate
-    result["churn_rate"] = round(
-        (result["churned"] / result["total"]) * 100,
-        2,
-    )
-
-    # Step 5 — Return result
-    return result
+    The aggregation itself lives in utils.churn_by_category so that the
+    EDA plots reuse the same cached result.
+    """
+    return churn_by_category(df, column)
 
 
 def get_top_churn_segments(df: pd.DataFrame) -> str:
@@ -206,5 +185,8 @@ def run_reporting_pipeline() -> None:
 
     save_report(report)
 
+    cache = aggregation_cache_info()
+    print(f"  Aggregation cache: {cache['hits']} hits, {cache['misses']} misses")
+
     print(f"  Report saved to {REPORTS_PATH}churn_summary_report.txt")
     print("Reporting complete!")
\ No newline at end of file
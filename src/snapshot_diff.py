@@ -0,0 +1,261 @@
+"""
+Snapshot Diff Module
+
+Compare two raw Telco Churn exports (e.g. last period's and this period's
+telco_churn.csv) and report what changed:
+
+- customers who are new, and customers who have left
+- customers whose Contract or MonthlyCharges changed
+- how the summary metrics and churn rates per Contract/InternetService moved
+
+Only a slim "fingerprint" of each snapshot is kept in memory: one hash per
+row plus the few columns the metrics need. The two snapshots are sorted on
+customerID and joined in one vectorised merge, so nothing from the cleaning
+or feature engineering pipelines has to be rerun.
+
+Usage:
+    python -m src.snapshot_diff old_snapshot.csv new_snapshot.csv
+"""
+
+import os
+import sys
+
+import pandas as pd
+from src.reporting import get_churn_by_category, get_dataset_summary
+from src.utils import REPORTS_PATH
+
+
+# Files bigger than this are read in chunks of SNAPSHOT_CHUNKSIZE rows
+SNAPSHOT_STREAM_BYTES = 256 * 1024 * 1024
+SNAPSHOT_CHUNKSIZE = 200_000
+
+ID_COLUMN = "customerID"
+METRIC_COLUMNS = ["Contract", "InternetService", "MonthlyCharges", "tenure", "Churn"]
+CATEGORY_COLUMNS = ["Contract", "InternetService"]
+
+
+def _fingerprint_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Reduce a chunk of raw rows to customerID, a row hash and the metric columns."""
+    slim = chunk[[ID_COLUMN] + METRIC_COLUMNS].copy()
+    slim["row_hash"] = pd.util.hash_pandas_object(
+        chunk.drop(columns=ID_COLUMN), index=False
+    ).to_numpy()
+    return slim
+
+
+def load_snapshot_fingerprints(path: str, chunksize: int = None) -> tuple:
+    """
+    Load the fingerprint of a raw snapshot, sorted by customerID.
+
+    Every column is read as text so that a row hashes the same way no matter
+    which chunk it lands in. Large files are streamed chunk by chunk.
+
+    Args:
+        path: Path to a raw telco_churn.csv export.
+        chunksize: Rows per chunk. Defaults to SNAPSHOT_CHUNKSIZE for files
+                   bigger than SNAPSHOT_STREAM_BYTES, otherwise one read.
+
+    Returns:
+        tuple: (fingerprint dataframe indexed by customerID, number of raw columns)
+
+    Raises:
+        ValueError: If the snapshot contains the same customerID twice.
+    """
+    if chunksize is None and os.path.getsize(path) > SNAPSHOT_STREAM_BYTES:
+        chunksize = SNAPSHOT_CHUNKSIZE
+
+    if chunksize:
+        pieces = []
+        n_columns = 0
+        for chunk in pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunksize):
+            n_columns = len(chunk.columns)
+            pieces.append(_fingerprint_chunk(chunk))
+        slim = pd.concat(pieces, ignore_index=True)
+    else:
+        raw = pd.read_csv(path, dtype=str, keep_default_na=False)
+        n_columns = len(raw.columns)
+        slim = _fingerprint_chunk(raw)
+
+    # Same conversions as the cleaning step, but only on the columns we kept
+    slim["MonthlyCharges"] = slim["MonthlyCharges"].astype(float)
+    slim["tenure"] = slim["tenure"].astype(int)
+
+    slim = slim.set_index(ID_COLUMN).sort_index()
+    if not slim.index.is_unique:
+        duplicated = slim.index[slim.index.duplicated()].unique().tolist()
+        raise ValueError(f"{path} has duplicate {ID_COLUMN} values: {duplicated[:5]}")
+
+    return slim, n_columns
+
+
+def _as_cleaned(slim: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drop rows the cleaning step would treat as duplicates.
+
+    check_for_duplicates() runs after customerID is dropped, so rows with
+    identical values in every other column count once. Those rows share a
+    row_hash here.
+    """
+    return slim[~slim["row_hash"].duplicated()]
+
+
+def _snapshot_summary(slim: pd.DataFrame, n_columns: int) -> dict:
+    """get_dataset_summary() for a de-duplicated fingerprint, as if run on the cleaned data."""
+    summary = get_dataset_summary(slim)
+    # The cleaned data keeps every raw column except customerID
+    summary["total_features"] = n_columns - 1
+    return summary
+
+
+def compare_summaries(old: dict, new: dict) -> pd.DataFrame:
+    """Put two get_dataset_summary() results side by side with their difference."""
+    result = pd.DataFrame({"old": pd.Series(old), "new": pd.Series(new)})
+    result["delta"] = result["new"] - result["old"]
+    return result
+
+
+def compare_churn_by_category(old: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+    """
+    Put two get_churn_by_category() results side by side.
+
+    Categories that only exist in one snapshot get 0 customers in the other.
+    """
+    result = old.join(new, how="outer", lsuffix="_old", rsuffix="_new").fillna(0)
+    for col in ["total_old", "total_new", "churned_old", "churned_new"]:
+        result[col] = result[col].astype(int)
+    result["churn_rate_delta"] = round(result["churn_rate_new"] - result["churn_rate_old"], 2)
+    return result
+
+
+def diff_snapshots(old_path: str, new_path: str, chunksize: int = None) -> dict:
+    """
+    Compare two raw snapshots.
+
+    Args:
+        old_path: The earlier raw export.
+        new_path: The later raw export.
+        chunksize: Passed on to load_snapshot_fingerprints().
+
+    Returns:
+        dict with these keys:
+        - 'new_customers': customerIDs only in the new snapshot (pd.Index)
+        - 'departed_customers': customerIDs only in the old snapshot (pd.Index)
+        - 'contract_changed': Contract_old / Contract_new per changed customer (pd.DataFrame)
+        - 'charges_changed': MonthlyCharges_old / MonthlyCharges_new per changed customer (pd.DataFrame)
+        - 'other_changed': customerIDs whose row changed in any other column (pd.Index)
+        - 'unchanged_count': customers whose row is identical (int)
+        - 'summary': old/new/delta of get_dataset_summary() (pd.DataFrame)
+        - 'churn_by_category': {column: compare_churn_by_category() result}
+
+    The customer lists cover every raw row. The metrics skip duplicate rows,
+    just like the cleaning pipeline does, so they match the cleaned-data report.
+    """
+    old, old_columns = load_snapshot_fingerprints(old_path, chunksize)
+    new, new_columns = load_snapshot_fingerprints(new_path, chunksize)
+
+    # Both sides are sorted and unique on customerID, so this is a single merge pass
+    merged = old.merge(
+        new,
+        how="outer",
+        left_index=True,
+        right_index=True,
+        suffixes=("_old", "_new"),
+        indicator=True,
+    )
+
+    both = merged[merged["_merge"] == "both"]
+    row_changed = both["row_hash_old"] != both["row_hash_new"]
+    contract_changed = row_changed & (both["Contract_old"] != both["Contract_new"])
+    charges_changed = row_changed & (both["MonthlyCharges_old"] != both["MonthlyCharges_new"])
+    other_changed = row_changed & ~contract_changed & ~charges_changed
+
+    old_cleaned = _as_cleaned(old)
+    new_cleaned = _as_cleaned(new)
+    churn_by_category = {
+        column: compare_churn_by_category(
+            get_churn_by_category(old_cleaned, column),
+            get_churn_by_category(new_cleaned, column),
+        )
+        for column in CATEGORY_COLUMNS
+    }
+
+    return {
+        "new_customers": merged.index[merged["_merge"] == "right_only"],
+        "departed_customers": merged.index[merged["_merge"] == "left_only"],
+        "contract_changed": both.loc[contract_changed, ["Contract_old", "Contract_new"]],
+        "charges_changed": both.loc[charges_changed, ["MonthlyCharges_old", "MonthlyCharges_new"]],
+        "other_changed": both.index[other_changed],
+        "unchanged_count": int((~row_changed).sum()),
+        "summary": compare_summaries(
+            _snapshot_summary(old_cleaned, old_columns),
+            _snapshot_summary(new_cleaned, new_columns),
+        ),
+        "churn_by_category": churn_by_category,
+    }
+
+
+def format_snapshot_diff(diff: dict) -> str:
+    """
+    Format the result of diff_snapshots() as a text report.
+    """
+
+    churn_sections = "\n\n".join(
+        f"Churn by {column}:\n{result[['churn_rate_old', 'churn_rate_new', 'churn_rate_delta']].to_string()}"
+        for column, result in diff["churn_by_category"].items()
+    )
+
+    report = f"""
+==========================================
+TELCO CUSTOMER CHURN — SNAPSHOT DIFF
+==========================================
+
+1. CUSTOMER CHANGES
+-------------------
+New Customers      : {len(diff['new_customers']):,}
+Departed Customers : {len(diff['departed_customers']):,}
+Contract Changed   : {len(diff['contract_changed']):,}
+Charges Changed    : {len(diff['charges_changed']):,}
+Other Changes      : {len(diff['other_changed']):,}
+Unchanged          : {diff['unchanged_count']:,}
+
+2. SUMMARY METRICS
+------------------
+{diff['summary'].to_string()}
+
+3. CHURN RATE CHANGES
+---------------------
+{churn_sections}
+
+==========================================
+""".strip("\n")
+
+    return report
+
+
+def run_snapshot_diff(old_path: str, new_path: str) -> dict:
+    """
+    Diff two raw snapshots, print the report and save it.
+
+    Returns:
+        dict: The result of diff_snapshots().
+    """
+    print("Starting Snapshot Diff...")
+    diff = diff_snapshots(old_path, new_path)
+    report = format_snapshot_diff(diff)
+
+    os.makedirs(REPORTS_PATH, exist_ok=True)
+    with open(REPORTS_PATH + "snapshot_diff_report.txt", "w", encoding="utf-8") as f:
+        f.write(report)
+
+    print(report)
+    print(f"  Report saved to {REPORTS_PATH}snapshot_diff_report.txt")
+    print("Snapshot Diff complete!")
+
+    return diff
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python -m src.snapshot_diff OLD_SNAPSHOT.csv NEW_SNAPSHOT.csv")
+        sys.exit(1)
+    run_snapshot_diff(sys.argv[1], sys.argv[2])
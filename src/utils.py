@@ -5,6 +5,19 @@ ALL contributors may add helper functions here.
 This file is shared — coordinate with your team if you're adding something!
 """
 
+import bz2
+import functools
+import gzip
+import hashlib
+import lzma
+import os
+import tempfile
+import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 import pandas as pd
 
 
@@ -14,6 +27,15 @@ CLEANED_DATA_PATH = "data/cleaned/telco_churn_cleaned.csv"
 FIGURES_PATH = "outputs/figures/"
 REPORTS_PATH = "outputs/reports/"
 
+# === Output settings ===
+# Compression for the cleaned/engineered CSVs: None, 'gzip', 'bz2' or 'lzma'.
+# gzip is fast, lzma gives the smallest files, bz2 sits in between.
+OUTPUT_COMPRESSION = None
+OUTPUT_CHUNKSIZE = 50_000
+
+# === Aggregation cache settings ===
+AGGREGATION_CACHE_SIZE = 128
+
 
 def load_raw_data() -> pd.DataFrame:
     """Load the raw Telco Churn dataset from CSV."""
@@ -22,7 +44,7 @@ def load_raw_data() -> pd.DataFrame:
 
 def load_cleaned_data() -> pd.DataFrame:
     """Load the cleaned dataset. Raises FileNotFoundError if cleaning hasn't been run yet."""
-    return pd.read_csv(CLEANED_DATA_PATH)
+    return pd.read_csv(output_path(CLEANED_DATA_PATH))
 
 
 # === Add your helper functions below ===
@@ -32,3 +54,316 @@ def load_cleaned_data() -> pd.DataFrame:
 # --- Added by Contributor A ---
 # def my_helper():
 #     pass
+
+
+# --- Added for the parallel output writers (used by save_cleaned_data and save_engineered_data) ---
+_COMPRESSORS = {
+    None: lambda data: data,
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "lzma": lzma.compress,
+}
+_EXTENSIONS = {None: "", "gzip": ".gz", "bz2": ".bz2", "lzma": ".xz"}
+
+
+def _resolve_compression(compression) -> str:
+    """Turn the 'default' sentinel into OUTPUT_COMPRESSION and check the codec name."""
+    if compression == "default":
+        compression = OUTPUT_COMPRESSION
+    if compression not in _COMPRESSORS:
+        raise ValueError(f"Unknown compression '{compression}', expected one of {list(_EXTENSIONS)}")
+    return compression
+
+
+def _current_umask() -> int:
+    """Read the process umask (os.umask can only be read by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def output_path(path: str, compression: str = "default") -> str:
+    """
+    Return the path a CSV is written to with the given compression,
+    e.g. 'data.csv' -> 'data.csv.gz' for gzip.
+    Uses OUTPUT_COMPRESSION unless compression is given (None means uncompressed).
+    """
+    return path + _EXTENSIONS[_resolve_compression(compression)]
+
+
+def write_csv(
+    df: pd.DataFrame,
+    path: str,
+    compression: str = "default",
+    chunksize: int = None,
+    max_workers: int = None,
+) -> dict:
+    """
+    Write a dataframe to CSV, compressing chunks in parallel.
+
+    Each chunk of rows is turned into CSV text (only the first one gets the
+    header) and compressed on its own. gzip, bz2 and xz all allow several
+    compressed streams to be glued together, so the chunks are simply
+    appended and pd.read_csv reads the result like any other compressed CSV.
+
+    Chunks are handled on a thread pool. DataFrame.to_csv holds the GIL, so
+    formatting is effectively one chunk at a time; the zlib/bz2/lzma calls
+    release it, so compression of several chunks runs in parallel. Only
+    about two chunks per worker are in flight at once, which keeps memory
+    bounded for large frames. Without compression there is nothing to run
+    in parallel, so the frame goes straight through a single to_csv call.
+
+    The file is written to a temp file next to the target, synced to disk
+    and renamed into place at the end, so readers never see a half-written
+    file. It gets the same permissions as a plain to_csv (0o666 minus umask).
+
+    Args:
+        df: The dataframe to save (written without the index).
+        path: Where to save it. The compression extension is added for you.
+        compression: None, 'gzip', 'bz2' or 'lzma'. Defaults to OUTPUT_COMPRESSION.
+        chunksize: Rows per chunk. Defaults to OUTPUT_CHUNKSIZE.
+        max_workers: Threads used for compressing chunks. Defaults to the CPU count.
+
+    Returns:
+        dict with these keys:
+        - 'path': the file that was written
+        - 'csv_bytes': size of the CSV text before compression
+        - 'bytes_written': size of the file on disk
+        - 'compression_ratio': csv_bytes / bytes_written
+        - 'seconds': time taken
+        - 'mb_per_s': throughput in MB of CSV text per second
+
+    Example:
+        >>> stats = write_csv(df, "data/cleaned/example.csv", compression="gzip")
+        >>> stats['path']
+        'data/cleaned/example.csv.gz'
+    """
+    compression = _resolve_compression(compression)
+    path = output_path(path, compression)
+    compress = _COMPRESSORS[compression]
+    chunksize = chunksize or OUTPUT_CHUNKSIZE
+    max_workers = max_workers or os.cpu_count() or 1
+
+    def encode_chunk(start: int) -> tuple:
+        chunk = df.iloc[start:start + chunksize]
+        raw = chunk.to_csv(index=False, header=(start == 0)).encode("utf-8")
+        return len(raw), compress(raw)
+
+    starts = iter(range(0, len(df), chunksize) if len(df) else [0])
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    began = time.perf_counter()
+    csv_bytes = 0
+    bytes_written = 0
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if compression is None:
+                df.to_csv(f, index=False, encoding="utf-8")
+                csv_bytes = bytes_written = f.tell()
+            else:
+                with ThreadPoolExecutor(max_workers) as pool:
+                    # Keep a small window of chunks in flight and write them back in order
+                    pending = deque(
+                        pool.submit(encode_chunk, start) for start in islice(starts, 2 * max_workers)
+                    )
+                    while pending:
+                        raw_size, data = pending.popleft().result()
+                        f.write(data)
+                        csv_bytes += raw_size
+                        bytes_written += len(data)
+                        for start in islice(starts, 1):
+                            pending.append(pool.submit(encode_chunk, start))
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates owner-only files; use the permissions open() would have given
+        os.chmod(tmp_path, 0o666 & ~_current_umask())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    seconds = time.perf_counter() - began
+
+    return {
+        "path": path,
+        "csv_bytes": csv_bytes,
+        "bytes_written": bytes_written,
+        "compression_ratio": round(csv_bytes / bytes_written, 2) if bytes_written else 1.0,
+        "seconds": round(seconds, 3),
+        "mb_per_s": round(csv_bytes / 1_000_000 / seconds, 2) if seconds > 0 else float("inf"),
+    }
+
+
+def format_write_stats(stats: dict) -> str:
+    """One-line summary of write_csv() stats for the pipeline logs."""
+    return (
+        f"{stats['csv_bytes'] / 1_000_000:.2f} MB of CSV -> "
+        f"{stats['bytes_written'] / 1_000_000:.2f} MB on disk "
+        f"(ratio {stats['compression_ratio']:.2f}) in {stats['seconds']:.2f}s "
+        f"({stats['mb_per_s']:.2f} MB/s)"
+    )
+
+
+# --- Added for the shared aggregation cache (used by reporting and eda) ---
+_AGGREGATION_CACHE = OrderedDict()
+_AGGREGATION_CACHE_STATS = {"hits": 0, "misses": 0}
+# id(df) -> {"ref": weakref to df, "layout": (shape, column names),
+#            "columns": {column: hash digest}, "keys": cache keys built from df}
+_FRAME_FINGERPRINTS = {}
+
+
+def _frame_entry(df: pd.DataFrame) -> dict:
+    """Return the remembered fingerprint state of a live frame, creating it if needed."""
+    key = id(df)
+    layout = (df.shape, tuple(df.columns))
+    entry = _FRAME_FINGERPRINTS.get(key)
+    if entry is not None and entry["ref"]() is df and entry["layout"] == layout:
+        return entry
+
+    def forget(ref):
+        # The frame is gone; drop its entry unless a newer frame took over the id
+        if _FRAME_FINGERPRINTS.get(key, {}).get("ref") is ref:
+            del _FRAME_FINGERPRINTS[key]
+
+    entry = {"ref": weakref.ref(df, forget), "layout": layout, "columns": {}, "keys": set()}
+    _FRAME_FINGERPRINTS[key] = entry
+    return entry
+
+
+def frame_fingerprint(df: pd.DataFrame, columns: list = None) -> str:
+    """
+    Fingerprint of a dataframe's contents.
+
+    Covers the shape, the column names, and the dtype and every value of
+    the given columns (all columns by default). Two loads of the same file
+    give the same fingerprint; frames that differ in any value of those
+    columns do not.
+
+    Hashing a column costs about as much as a simple aggregation, so each
+    column is hashed once per frame object and remembered while the frame
+    is alive. A change of shape or column names triggers new hashes.
+    Editing values in place does not: call invalidate_aggregation_cache(df)
+    after doing that.
+    """
+    entry = _frame_entry(df)
+    columns = list(df.columns) if columns is None else list(columns)
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(entry["layout"]).encode("utf-8"))
+    for col in columns:
+        if col not in entry["columns"]:
+            col_digest = hashlib.blake2b(str(df[col].dtype).encode("utf-8"), digest_size=16)
+            col_digest.update(pd.util.hash_pandas_object(df[col], index=False).to_numpy().tobytes())
+            entry["columns"][col] = col_digest.digest()
+        digest.update(repr(col).encode("utf-8"))
+        digest.update(entry["columns"][col])
+    return digest.hexdigest()
+
+
+def memoize_aggregation(func=None, *, columns=None):
+    """
+    Decorator that caches an aggregation over a dataframe.
+
+    The first argument must be the dataframe; the cache key is the function,
+    frame_fingerprint(df, columns) and the remaining arguments. All
+    decorated functions share one LRU cache of AGGREGATION_CACHE_SIZE
+    entries. Callers get a copy of the cached result, so changing it does
+    not change the cache.
+
+    Args:
+        columns: The columns the aggregation reads, so only those are hashed.
+                 Either a list, or a function taking the same arguments as
+                 the aggregation and returning a list. Defaults to every column.
+
+    Example:
+        >>> @memoize_aggregation(columns=lambda df, column: [column, "Churn"])
+        ... def churn_counts(df, column):
+        ...     return df.groupby(column)["Churn"].value_counts()
+    """
+    if func is None:
+        return lambda f: memoize_aggregation(f, columns=columns)
+
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(df, *args, **kwargs):
+        used = columns(df, *args, **kwargs) if callable(columns) else columns
+        key = (name, frame_fingerprint(df, used), args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments (e.g. a list of columns) just skip the cache
+            return func(df, *args, **kwargs)
+
+        _frame_entry(df)["keys"].add(key)
+        if key in _AGGREGATION_CACHE:
+            _AGGREGATION_CACHE_STATS["hits"] += 1
+            _AGGREGATION_CACHE.move_to_end(key)
+            result = _AGGREGATION_CACHE[key]
+        else:
+            _AGGREGATION_CACHE_STATS["misses"] += 1
+            result = func(df, *args, **kwargs)
+            _AGGREGATION_CACHE[key] = result
+            while len(_AGGREGATION_CACHE) > AGGREGATION_CACHE_SIZE:
+                _AGGREGATION_CACHE.popitem(last=False)
+
+        return result.copy() if hasattr(result, "copy") else result
+
+    return wrapper
+
+
+def invalidate_aggregation_cache(df: pd.DataFrame = None) -> int:
+    """
+    Drop cached aggregations for one dataframe, or everything if df is None.
+
+    Call this after editing a frame in place; its columns are hashed again
+    on the next aggregation.
+
+    Returns:
+        int: Number of cache entries removed.
+    """
+    if df is None:
+        removed = len(_AGGREGATION_CACHE)
+        _AGGREGATION_CACHE.clear()
+        _FRAME_FINGERPRINTS.clear()
+        return removed
+
+    entry = _FRAME_FINGERPRINTS.pop(id(df), None)
+    if entry is None or entry["ref"]() is not df:
+        return 0
+    stale = [key for key in entry["keys"] if key in _AGGREGATION_CACHE]
+    for key in stale:
+        del _AGGREGATION_CACHE[key]
+    return len(stale)
+
+
+def aggregation_cache_info() -> dict:
+    """Return the cache's 'hits', 'misses', 'size' and 'maxsize'."""
+    return {
+        **_AGGREGATION_CACHE_STATS,
+        "size": len(_AGGREGATION_CACHE),
+        "maxsize": AGGREGATION_CACHE_SIZE,
+    }
+
+
+@memoize_aggregation(columns=lambda df, column: [column, "Churn"])
+def churn_by_category(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    Count customers and churned customers per value of a column.
+
+    Shared by reporting (get_churn_by_category) and eda (the churn-rate
+    plots), so each breakdown is computed once per dataset.
+
+    Returns:
+        pd.DataFrame: Indexed by the column's values, with 'total', 'churned'
+                      and 'churn_rate' (percentage, rounded to 2 decimals).
+    """
+    total = df.groupby(column).size().rename("total")
+    churned = df[df["Churn"] == "Yes"].groupby(column).size().rename("churned")
+
+    result = pd.concat([total, churned], axis=1).fillna(0)
+    result["churned"] = result["churned"].astype(int)
+    result["churn_rate"] = round((result["churned"] / result["total"]) * 100, 2)
+    return result
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_cleaning import fix_senior_citizen, fix_total_charges
+from src.feature_engineering import (
+    DERIVED_FEATURES,
+    TENURE_GROUP_LABELS,
+    TENURE_GROUP_UPPER_BOUNDS,
+    compute_derived_features,
+    resolve_feature_order,
+)
+from src.utils import RAW_DATA_PATH
+
+
+def _cleaned_raw() -> pd.DataFrame:
+    return fix_senior_citizen(fix_total_charges(pd.read_csv(RAW_DATA_PATH)))
+
+
+def test_tenure_group_matches_pd_cut_for_whole_months():
+    tenure = pd.Series(range(1, 73))
+    expected = pd.cut(tenure, bins=[0] + TENURE_GROUP_UPPER_BOUNDS, labels=TENURE_GROUP_LABELS).astype(str)
+
+    result = compute_derived_features(pd.DataFrame({"tenure": tenure}), ["tenure_group"])
+
+    assert result["tenure_group"].tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize(
+    "tenure, group",
+    [(0, "0-1 year"), (12.5, "nan"), (np.nan, "nan"), (-1, "nan"), (73, "nan")],
+)
+def test_tenure_group_edge_values(tenure, group):
+    df = pd.DataFrame({"tenure": [tenure]})
+    assert compute_derived_features(df, ["tenure_group"])["tenure_group"].tolist() == [group]
+
+
+def test_chunked_run_matches_single_pass():
+    single = compute_derived_features(_cleaned_raw())
+    chunked = compute_derived_features(_cleaned_raw(), chunksize=1_000)
+    pd.testing.assert_frame_equal(single, chunked)
+
+
+def test_only_requested_features_are_added():
+    df = _cleaned_raw()
+    before = list(df.columns)
+
+    result = compute_derived_features(df, ["has_streaming"])
+
+    assert list(result.columns) == before + ["has_streaming"]
+
+
+def test_unknown_feature_raises():
+    with pytest.raises(ValueError, match="Unknown derived feature"):
+        resolve_feature_order(["not_a_feature"])
+
+
+def test_dependency_cycle_raises(monkeypatch):
+    monkeypatch.setitem(DERIVED_FEATURES, "cycle_a", {"inputs": ["cycle_b"], "compute": None})
+    monkeypatch.setitem(DERIVED_FEATURES, "cycle_b", {"inputs": ["cycle_a"], "compute": None})
+    with pytest.raises(ValueError, match="circular dependency"):
+        resolve_feature_order(["cycle_a"])
+
+
+def test_dependencies_come_first_and_are_not_kept(monkeypatch):
+    monkeypatch.setitem(
+        DERIVED_FEATURES,
+        "streaming_services",
+        {"inputs": ["has_streaming", "num_services"], "compute": lambda cols: cols["num_services"] * cols["has_streaming"]},
+    )
+    order = resolve_feature_order(["streaming_services"])
+    assert order.index("has_streaming") < order.index("streaming_services")
+    assert order.index("num_services") < order.index("streaming_services")
+
+    result = compute_derived_features(_cleaned_raw(), ["streaming_services"])
+    assert "streaming_services" in result.columns
+    assert "has_streaming" not in result.columns
@@ -0,0 +1,55 @@
+import pandas as pd
+
+import src.data_cleaning as data_cleaning
+from src.reporting import get_churn_by_category, get_dataset_summary
+from src.snapshot_diff import diff_snapshots
+from src.utils import RAW_DATA_PATH
+
+
+def _write_snapshots(tmp_path, new_df: pd.DataFrame) -> tuple:
+    old_path = tmp_path / "old.csv"
+    new_path = tmp_path / "new.csv"
+    pd.read_csv(RAW_DATA_PATH, dtype=str, keep_default_na=False).to_csv(old_path, index=False)
+    new_df.to_csv(new_path, index=False)
+    return old_path, new_path
+
+
+def test_contract_and_churn_change_moves_the_metrics(tmp_path):
+    new_df = pd.read_csv(RAW_DATA_PATH, dtype=str, keep_default_na=False)
+    flip = new_df.index[(new_df["Contract"] == "Month-to-month") & (new_df["Churn"] == "Yes")][0]
+    new_df.loc[flip, "Contract"] = "Two year"
+    new_df.loc[flip, "Churn"] = "No"
+    old_path, new_path = _write_snapshots(tmp_path, new_df)
+
+    diff = diff_snapshots(old_path, new_path)
+
+    assert list(diff["contract_changed"].index) == [new_df.loc[flip, "customerID"]]
+    assert diff["summary"].loc["churned_count", "delta"] == -1
+    assert diff["summary"].loc["churn_rate", "delta"] < 0
+
+    by_contract = diff["churn_by_category"]["Contract"]
+    assert by_contract.loc["Month-to-month", "churned_new"] == by_contract.loc["Month-to-month", "churned_old"] - 1
+    assert by_contract.loc["Month-to-month", "churn_rate_delta"] != 0
+    assert by_contract.loc["Two year", "total_new"] == by_contract.loc["Two year", "total_old"] + 1
+
+
+def test_summary_matches_cleaned_data(tmp_path, monkeypatch):
+    # Every cleaning step, without writing the cleaned CSV
+    monkeypatch.setattr(data_cleaning, "save_cleaned_data", lambda df: None)
+    cleaned = data_cleaning.run_cleaning_pipeline()
+    raw = pd.read_csv(RAW_DATA_PATH)
+    new_df = pd.read_csv(RAW_DATA_PATH, dtype=str, keep_default_na=False)
+    old_path, new_path = _write_snapshots(tmp_path, new_df)
+
+    diff = diff_snapshots(old_path, new_path)
+
+    expected = get_dataset_summary(cleaned)
+    for key, value in expected.items():
+        assert diff["summary"].loc[key, "old"] == value
+        assert diff["summary"].loc[key, "delta"] == 0
+    assert diff["unchanged_count"] == len(raw)
+
+    for column, result in diff["churn_by_category"].items():
+        expected_by_category = get_churn_by_category(cleaned, column)
+        assert result["total_old"].tolist() == expected_by_category["total"].tolist()
+        assert result["churn_rate_old"].tolist() == expected_by_category["churn_rate"].tolist()
@@ -0,0 +1,165 @@
+import gzip
+import os
+import time
+
+import pandas as pd
+import pytest
+
+import src.utils as utils
+from src.utils import (
+    aggregation_cache_info,
+    churn_by_category,
+    frame_fingerprint,
+    invalidate_aggregation_cache,
+    memoize_aggregation,
+    output_path,
+    write_csv,
+)
+
+
+@memoize_aggregation
+def _churned_count(df: pd.DataFrame) -> int:
+    return int((df["Churn"] == "Yes").sum())
+
+
+def _frame(n_rows: int = 5_000) -> pd.DataFrame:
+    return pd.DataFrame({"Churn": ["No"] * n_rows, "tenure": range(n_rows)})
+
+
+def test_same_contents_give_same_fingerprint():
+    assert frame_fingerprint(_frame()) == frame_fingerprint(_frame())
+
+
+def test_frames_differing_in_one_middle_row_miss_the_cache():
+    invalidate_aggregation_cache()
+    first = _frame()
+    second = _frame()
+    middle = len(second) // 2 + 1
+    second.loc[middle, "Churn"] = "Yes"
+
+    assert frame_fingerprint(first) != frame_fingerprint(second)
+
+    before = aggregation_cache_info()
+    assert _churned_count(first) == 0
+    assert _churned_count(second) == 1
+    after = aggregation_cache_info()
+
+    assert after["hits"] - before["hits"] == 0
+    assert after["misses"] - before["misses"] == 2
+
+
+def test_repeated_call_hits_the_cache_until_invalidated():
+    invalidate_aggregation_cache()
+    df = _frame()
+    before = aggregation_cache_info()
+
+    _churned_count(df)
+    _churned_count(df)
+    assert aggregation_cache_info()["hits"] - before["hits"] == 1
+
+    assert invalidate_aggregation_cache(df) == 1
+    _churned_count(df)
+    assert aggregation_cache_info()["misses"] - before["misses"] == 2
+
+
+def test_columns_are_hashed_once_per_frame(monkeypatch):
+    invalidate_aggregation_cache()
+    hashed = []
+    real_hash = pd.util.hash_pandas_object
+    monkeypatch.setattr(pd.util, "hash_pandas_object", lambda obj, **kw: hashed.append(obj.name) or real_hash(obj, **kw))
+    df = _frame()
+
+    for _ in range(5):
+        churn_by_category(df, "tenure")
+
+    # Only the columns churn_by_category reads, each hashed once
+    assert sorted(hashed) == ["Churn", "tenure"]
+
+
+def test_in_place_edit_is_picked_up_after_invalidation():
+    invalidate_aggregation_cache()
+    df = _frame()
+    assert _churned_count(df) == 0
+
+    df.loc[10, "Churn"] = "Yes"
+    invalidate_aggregation_cache(df)
+
+    assert _churned_count(df) == 1
+
+
+def test_repeated_aggregation_is_cheaper_than_recomputing():
+    invalidate_aggregation_cache()
+    n_rows = 200_000
+    df = pd.DataFrame({
+        "Contract": ["Month-to-month", "One year", "Two year", "One year"] * (n_rows // 4),
+        "Churn": ["Yes", "No", "No", "No"] * (n_rows // 4),
+    })
+    churn_by_category(df, "Contract")
+
+    def best_of(func, repeat=5):
+        timings = []
+        for _ in range(repeat):
+            began = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - began)
+        return min(timings)
+
+    cached = best_of(lambda: churn_by_category(df, "Contract"))
+    uncached = best_of(lambda: churn_by_category.__wrapped__(df, "Contract"))
+
+    assert cached < uncached
+
+
+def _small_frame() -> pd.DataFrame:
+    return pd.DataFrame({"customer": [f"c{i}" for i in range(7)], "tenure": range(7), "charges": [1.5] * 7})
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "lzma"])
+def test_write_csv_round_trips_concatenated_streams(tmp_path, compression):
+    df = _small_frame()
+
+    stats = write_csv(df, str(tmp_path / "out.csv"), compression=compression, chunksize=2)
+
+    assert stats["path"] == output_path(str(tmp_path / "out.csv"), compression)
+    assert stats["bytes_written"] == os.path.getsize(stats["path"])
+    pd.testing.assert_frame_equal(pd.read_csv(stats["path"]), df)
+
+
+def test_output_path_none_versus_default(monkeypatch):
+    monkeypatch.setattr(utils, "OUTPUT_COMPRESSION", "gzip")
+    assert output_path("data.csv") == "data.csv.gz"
+    assert output_path("data.csv", "default") == "data.csv.gz"
+    assert output_path("data.csv", None) == "data.csv"
+
+
+def test_write_csv_writes_header_once(tmp_path):
+    stats = write_csv(_small_frame(), str(tmp_path / "out.csv"), compression="gzip", chunksize=2)
+
+    with gzip.open(stats["path"], "rt") as f:
+        lines = f.read().splitlines()
+
+    assert lines.count("customer,tenure,charges") == 1
+    assert len(lines) == 8
+
+
+def test_write_csv_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    def broken_compress(data):
+        raise RuntimeError("disk on fire")
+
+    monkeypatch.setitem(utils._COMPRESSORS, "gzip", broken_compress)
+
+    with pytest.raises(RuntimeError):
+        write_csv(_small_frame(), str(tmp_path / "out.csv"), compression="gzip", chunksize=2)
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_write_csv_respects_umask(tmp_path):
+    old_umask = os.umask(0o027)
+    try:
+        stats = write_csv(_small_frame(), str(tmp_path / "out.csv"), compression=None)
+    finally:
+        os.umask(old_umask)
+
+    assert os.stat(stats["path"]).st_mode & 0o777 == 0o640
+    assert stats["csv_bytes"] == stats["bytes_written"] == os.path.getsize(stats["path"])